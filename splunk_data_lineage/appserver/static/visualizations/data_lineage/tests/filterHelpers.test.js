@@ -16,12 +16,8 @@ describe('filterGraph', () => {
         { source: 'node3', target: 'node4', sourcetype: 'typeA' }
     ];
 
-    test('returns original arrays if sourcetype is not provided or is "All"', () => {
-        let result = filterGraph(nodes, links, null);
-        expect(result.filteredNodes).toEqual(nodes);
-        expect(result.filteredLinks).toEqual(links);
-
-        result = filterGraph(nodes, links, 'All');
+    test.each([null, undefined, '', 'All'])('returns original arrays if sourcetype is %p', (sourcetype) => {
+        const result = filterGraph(nodes, links, sourcetype);
         expect(result.filteredNodes).toEqual(nodes);
         expect(result.filteredLinks).toEqual(links);
     });